@@ -11,6 +11,11 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(60, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     jwt_algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     master_db_name: str = Field("org_master", alias="MASTER_DB_NAME")
+    debug: bool = Field(False, alias="DEBUG")
+    mongo_max_pool_size: int = Field(50, alias="MONGO_MAX_POOL_SIZE")
+    mongo_min_pool_size: int = Field(10, alias="MONGO_MIN_POOL_SIZE")
+    mongo_server_selection_timeout_ms: int = Field(5000, alias="MONGO_SERVER_SELECTION_TIMEOUT_MS")
+    mongo_connect_timeout_ms: int = Field(3000, alias="MONGO_CONNECT_TIMEOUT_MS")
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -1,38 +1,51 @@
 import re
-from typing import AsyncIterator
+from functools import lru_cache
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.core.config import settings
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_MASTER_DB_NAME = settings.master_db_name
+
 
 class MongoConnectionManager:
     """Create and manage MongoDB client connections."""
 
     def __init__(self) -> None:
-        self._client: AsyncIOMotorClient | None = None
+        self._client: AsyncMongoClient | None = None
 
-    def get_client(self) -> AsyncIOMotorClient:
+    def get_client(self) -> AsyncMongoClient:
         if self._client is None:
-            self._client = AsyncIOMotorClient(settings.mongo_uri)
+            self._client = AsyncMongoClient(
+                settings.mongo_uri,
+                maxPoolSize=settings.mongo_max_pool_size,
+                minPoolSize=settings.mongo_min_pool_size,
+                serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+                connectTimeoutMS=settings.mongo_connect_timeout_ms,
+            )
         return self._client
 
-    def get_master_db(self) -> AsyncIOMotorDatabase:
-        return self.get_client()[settings.master_db_name]
+    def get_master_db(self) -> AsyncDatabase:
+        return self.get_client()[_MASTER_DB_NAME]
 
     async def close(self) -> None:
         if self._client is not None:
-            self._client.close()
+            await self._client.close()
             self._client = None
 
 
+@lru_cache(maxsize=1024)
 def normalize_org_name(organization_name: str) -> str:
     """Create a safe slug for collection names (letters, numbers, underscore)."""
 
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", organization_name.strip().lower())
+    slug = _SLUG_RE.sub("_", organization_name.strip().lower())
     return slug.strip("_") or "org"
 
 
+@lru_cache(maxsize=1024)
 def build_org_collection_name(organization_name: str) -> str:
     return f"org_{normalize_org_name(organization_name)}"
 
@@ -40,14 +53,6 @@ def build_org_collection_name(organization_name: str) -> str:
 mongo_manager = MongoConnectionManager()
 
 
-async def get_master_db() -> AsyncIterator[AsyncIOMotorDatabase]:
-    db = mongo_manager.get_master_db()
-    try:
-        yield db
-    finally:
-        pass  # no swallow
-
-
-def get_org_collection(db: AsyncIOMotorDatabase, organization_name: str) -> AsyncIOMotorCollection:
+def get_org_collection(db: AsyncDatabase, organization_name: str) -> AsyncCollection:
     collection_name = build_org_collection_name(organization_name)
     return db[collection_name]
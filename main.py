@@ -1,13 +1,18 @@
 from fastapi import FastAPI
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
 
+from app.core.config import settings
 from app.core.database import mongo_manager
 from app.routes import admin_routes, org_routes
+from app.services.admin_service import AdminService
+from app.services.organization_service import OrganizationService
 
-   app = FastAPI(
-       title="Organization Management Service",
-       version="0.1.0",
-       debug=True,  # add this line temporarily
-   )
+app = FastAPI(
+    title="Organization Management Service",
+    version="0.1.0",
+    debug=settings.debug,
+)
 
 app.include_router(org_routes.router)
 app.include_router(admin_routes.router)
@@ -18,6 +23,35 @@ async def health_check() -> dict:
     return {"status": "ok"}
 
 
+@app.on_event("startup")
+async def startup_event() -> None:
+    # Build the shared client up front so the first requests don't race on construction
+    mongo_manager.get_client()
+    master_db = mongo_manager.get_master_db()
+    # Back the name/email lookups with B-tree indexes and let Mongo enforce uniqueness;
+    # collection_name is unique too so names that slug the same can't share a tenant collection
+    try:
+        await master_db["organizations"].create_indexes(
+            [
+                IndexModel([("name_lower", ASCENDING)], unique=True),
+                IndexModel([("email", ASCENDING)], unique=True),
+                IndexModel([("collection_name", ASCENDING)], unique=True),
+            ]
+        )
+    except OperationFailure as exc:
+        # Existing data with duplicate emails or shared collection names can't get the unique indexes
+        detail = (exc.details or {}).get("errmsg", str(exc))
+        raise RuntimeError(
+            "Cannot build unique indexes on 'organizations'; resolve the duplicate "
+            f"name_lower/email/collection_name values before starting: {detail}"
+        ) from exc
+    # Services only hold collection handles, so one shared instance serves every request.
+    # The routes' get_service dependencies read these, so the app must be started through its
+    # lifespan (e.g. `with TestClient(app)`), or get_service overridden via dependency_overrides.
+    app.state.org_service = OrganizationService(master_db)
+    app.state.admin_service = AdminService(master_db)
+
+
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     await mongo_manager.close()
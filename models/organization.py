@@ -1,22 +1,43 @@
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, EmailStr, Field, constr
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, constr
+
+
+def _normalize_email(value: Any) -> Any:
+    """Lower-case and trim emails once at the validation boundary."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+
+NormalizedEmail = Annotated[EmailStr, BeforeValidator(_normalize_email)]
 
 
 class OrganizationCreate(BaseModel):
     """Schema for creating a new organization."""
     organization_name: constr(min_length=3, max_length=64) = Field(..., description="Canonical organization name")
-    email: EmailStr = Field(..., description="Primary admin email")
+    email: NormalizedEmail = Field(..., description="Primary admin email")
     password: constr(min_length=8, max_length=128) = Field(..., description="Admin password")
 
+    @cached_property
+    def organization_name_lower(self) -> str:
+        return self.organization_name.lower().strip()
+
 
 class OrganizationUpdate(BaseModel):
     """Schema for updating an organization."""
     organization_name: Optional[constr(min_length=3, max_length=64)] = Field(None, description="New organization name")
-    email: Optional[EmailStr] = Field(None, description="New admin email")
+    email: Optional[NormalizedEmail] = Field(None, description="New admin email")
     password: Optional[constr(min_length=8, max_length=128)] = Field(None, description="New admin password")
 
+    @cached_property
+    def organization_name_lower(self) -> Optional[str]:
+        if self.organization_name is None:
+            return None
+        return self.organization_name.lower().strip()
+
 
 class OrganizationResponse(BaseModel):
     """Response schema for organization data."""
@@ -30,7 +51,7 @@ class OrganizationResponse(BaseModel):
 
 class AdminLoginRequest(BaseModel):
     """Schema for admin login."""
-    email: EmailStr = Field(..., description="Admin email")
+    email: NormalizedEmail = Field(..., description="Admin email")
     password: constr(min_length=8, max_length=128) = Field(..., description="Admin password")
 
 
@@ -1,14 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.core.database import get_master_db
 from app.models.organization import AdminLoginRequest, TokenResponse
 from app.services.admin_service import AdminService
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-async def get_service(master_db=Depends(get_master_db)) -> AdminService:
-    return AdminService(master_db)
+async def get_service(request: Request) -> AdminService:
+    return request.app.state.admin_service
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -1,8 +1,5 @@
-import traceback
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from app.core.database import get_master_db
 from app.models.organization import OrganizationCreate, OrganizationResponse, OrganizationUpdate
 from app.services.organization_service import OrganizationService
 from app.utils.dependencies import get_current_admin
@@ -10,13 +7,9 @@ from app.utils.dependencies import get_current_admin
 router = APIRouter(prefix="/org", tags=["organizations"])
 
 
-async def get_service(master_db=Depends(get_master_db)) -> OrganizationService:
-    """Dependency to get OrganizationService instance."""
-    try:
-        return OrganizationService(master_db)
-    except Exception:
-        traceback.print_exc()
-        raise
+async def get_service(request: Request) -> OrganizationService:
+    """Dependency to get the shared OrganizationService instance bound at startup."""
+    return request.app.state.org_service
 
 
 @router.post("/create", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
@@ -25,10 +18,6 @@ async def create_organization(payload: OrganizationCreate, service: Organization
         return await service.create_organization(payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    except Exception as exc:
-        # TEMP logging to surface the real error
-        traceback.print_exc()
-        raise
 
 
 @router.get("/get", response_model=OrganizationResponse)
@@ -1,6 +1,6 @@
 from typing import Dict
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.models.organization import AdminLoginRequest, TokenResponse
 from app.utils.jwt_handler import JWTHandler
@@ -10,16 +10,18 @@ from app.utils.security import PasswordHasher
 class AdminService:
     """Handle admin authentication and token issuance."""
 
-    def __init__(self, master_db: AsyncIOMotorDatabase) -> None:
+    def __init__(self, master_db: AsyncDatabase) -> None:
         self.organizations = master_db["organizations"]
 
     async def login(self, payload: AdminLoginRequest) -> TokenResponse:
         """Authenticate admin and generate JWT token with admin_email and organization_name."""
-        org_doc = await self.organizations.find_one({"email": payload.email.lower().strip()})
+        org_doc = await self.organizations.find_one(
+            {"email": payload.email}, projection={"email": 1, "name": 1, "password_hash": 1}
+        )
         if org_doc is None:
             raise ValueError("Invalid credentials")
 
-        if not PasswordHasher.verify_password(payload.password, org_doc["password_hash"]):
+        if not await PasswordHasher.verify_password_async(payload.password, org_doc["password_hash"]):
             raise ValueError("Invalid credentials")
 
         # JWT payload must include admin_email and organization_name as per requirements
@@ -1,56 +1,64 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
 from app.core.database import build_org_collection_name
 from app.models.organization import OrganizationCreate, OrganizationResponse, OrganizationUpdate
 from app.utils.security import PasswordHasher
 
+NAMESPACE_NOT_FOUND = 26
+NAMESPACE_EXISTS = 48
+
+# Fields needed by _serialize_org; read paths never pull password_hash
+ORG_RESPONSE_PROJECTION = {"name": 1, "email": 1, "collection_name": 1, "created_at": 1, "updated_at": 1}
+
 
 class OrganizationService:
     """Business logic around organization lifecycle management."""
 
-    def __init__(self, master_db: AsyncIOMotorDatabase) -> None:
+    def __init__(self, master_db: AsyncDatabase) -> None:
         self.db = master_db
         self.organizations = master_db["organizations"]
 
     async def create_organization(self, payload: OrganizationCreate) -> OrganizationResponse:
         """Create a new organization with admin credentials and tenant collection."""
-        normalized_name = payload.organization_name.lower().strip()
-        existing = await self.organizations.find_one({"name_lower": normalized_name})
-        if existing:
-            raise ValueError("Organization already exists")
-
+        normalized_name = payload.organization_name_lower
         now = datetime.now(timezone.utc)
         collection_name = build_org_collection_name(payload.organization_name)
 
-        # Create the tenant collection
-        await self._ensure_collection_exists(collection_name)
-
         # Hash password
-        password_hash = PasswordHasher.hash_password(payload.password)
+        password_hash = await PasswordHasher.hash_password_async(payload.password)
 
         # Create organization document in master collection
         org_doc: Dict[str, Any] = {
             "name": payload.organization_name,
             "name_lower": normalized_name,
-            "email": payload.email.lower(),
+            "email": payload.email,
             "password_hash": password_hash,
             "collection_name": collection_name,
             "created_at": now,
             "updated_at": now,
         }
 
-        org_insert = await self.organizations.insert_one(org_doc)
+        # Unique indexes on name_lower/email reject duplicates in the same round-trip
+        try:
+            org_insert = await self.organizations.insert_one(org_doc)
+        except DuplicateKeyError as exc:
+            raise ValueError(self._duplicate_key_message(exc)) from exc
         org_doc["_id"] = org_insert.inserted_id
 
+        # Create the tenant collection
+        await self._ensure_collection_exists(collection_name)
+
         return self._serialize_org(org_doc)
 
     async def get_organization(self, organization_name: str) -> Optional[OrganizationResponse]:
         """Retrieve organization by name."""
         normalized_name = organization_name.lower().strip()
-        org_doc = await self.organizations.find_one({"name_lower": normalized_name})
+        org_doc = await self.organizations.find_one({"name_lower": normalized_name}, projection=ORG_RESPONSE_PROJECTION)
         if org_doc:
             return self._serialize_org(org_doc)
         return None
@@ -64,50 +72,67 @@ class OrganizationService:
         self, current_org_name: str, payload: OrganizationUpdate
     ) -> OrganizationResponse:
         """Update organization metadata and migrate collection if name changes."""
-        # Find current organization
         normalized_name = current_org_name.lower().strip()
-        org_doc = await self.organizations.find_one({"name_lower": normalized_name})
-        if org_doc is None:
-            raise ValueError("Organization not found")
-
         updates: Dict[str, Any] = {}
-        old_collection_name = org_doc["collection_name"]
         new_collection_name: Optional[str] = None
 
         # Check if organization name is being changed
-        if payload.organization_name and payload.organization_name.lower().strip() != normalized_name:
-            new_normalized = payload.organization_name.lower().strip()
-            # Check if new name already exists
-            existing = await self.organizations.find_one({"name_lower": new_normalized})
-            if existing:
-                raise ValueError("Organization name already exists")
+        if payload.organization_name and payload.organization_name_lower != normalized_name:
             updates["name"] = payload.organization_name
-            updates["name_lower"] = new_normalized
+            updates["name_lower"] = payload.organization_name_lower
             new_collection_name = build_org_collection_name(payload.organization_name)
             updates["collection_name"] = new_collection_name
 
         if payload.email:
-            updates["email"] = payload.email.lower().strip()
+            updates["email"] = payload.email
 
         if payload.password:
-            updates["password_hash"] = PasswordHasher.hash_password(payload.password)
+            updates["password_hash"] = await PasswordHasher.hash_password_async(payload.password)
 
-        now = datetime.now(timezone.utc)
         if updates:
-            updates["updated_at"] = now
-            await self.organizations.update_one({"_id": org_doc["_id"]}, {"$set": updates})
-            org_doc.update(updates)
+            updates["updated_at"] = datetime.now(timezone.utc)
+            # Read and write in one round-trip; the unique indexes reject name/email collisions.
+            # Return the pre-update document so the stored collection_name drives the migration
+            # and every updated field can be restored if the migration fails.
+            projection = ORG_RESPONSE_PROJECTION
+            if "password_hash" in updates:
+                projection = {**ORG_RESPONSE_PROJECTION, "password_hash": 1}
+            try:
+                org_doc = await self.organizations.find_one_and_update(
+                    {"name_lower": normalized_name},
+                    {"$set": updates},
+                    projection=projection,
+                    return_document=ReturnDocument.BEFORE,
+                )
+            except DuplicateKeyError as exc:
+                raise ValueError(self._duplicate_key_message(exc, "Organization name already exists")) from exc
+        else:
+            org_doc = await self.organizations.find_one(
+                {"name_lower": normalized_name}, projection=ORG_RESPONSE_PROJECTION
+            )
+
+        if org_doc is None:
+            raise ValueError("Organization not found")
+
+        old_collection_name = org_doc["collection_name"]
 
         # Migrate collection if name changed
         if new_collection_name and new_collection_name != old_collection_name:
-            await self._migrate_collection(old_collection_name, new_collection_name)
+            try:
+                await self._migrate_collection(old_collection_name, new_collection_name)
+            except Exception:
+                # The master doc already points at the new collection; restore it so the tenant stays reachable
+                await self.organizations.update_one(
+                    {"_id": org_doc["_id"]}, {"$set": {key: org_doc[key] for key in updates if key in org_doc}}
+                )
+                raise
 
-        return self._serialize_org(org_doc)
+        return self._serialize_org({**org_doc, **updates})
 
     async def delete_organization(self, organization_name: str) -> bool:
         """Delete organization and its tenant collection."""
         normalized_name = organization_name.lower().strip()
-        org_doc = await self.organizations.find_one({"name_lower": normalized_name})
+        org_doc = await self.organizations.find_one({"name_lower": normalized_name}, projection={"collection_name": 1})
         if org_doc is None:
             raise ValueError("Organization not found")
 
@@ -118,33 +143,43 @@ class OrganizationService:
         return True
 
     async def _ensure_collection_exists(self, collection_name: str) -> None:
-        existing_collections = await self.db.list_collection_names()
-        if collection_name not in existing_collections:
-            await self.db.create_collection(collection_name)
+        # check_exists=False skips the listCollections pre-check; an existing collection surfaces as code 48
+        try:
+            await self.db.create_collection(collection_name, check_exists=False)
+        except OperationFailure as exc:
+            if exc.code != NAMESPACE_EXISTS:
+                raise
 
     async def _drop_collection(self, collection_name: str) -> None:
-        existing_collections = await self.db.list_collection_names()
-        if collection_name in existing_collections:
-            await self.db.drop_collection(collection_name)
+        # Dropping a missing collection is a no-op (NamespaceNotFound is ignored by the driver)
+        await self.db.drop_collection(collection_name)
 
     async def _migrate_collection(self, old_collection_name: str, new_collection_name: str) -> None:
         if old_collection_name == new_collection_name:
             return
 
-        await self._ensure_collection_exists(new_collection_name)
-        old_collection = self.db[old_collection_name]
-        new_collection = self.db[new_collection_name]
-
-        documents = await old_collection.find().to_list(length=None)
-        if documents:
-            await new_collection.delete_many({})
-            await new_collection.insert_many(documents)
-
-        await old_collection.drop()
+        # renameCollection moves the data server-side in O(metadata); never drop an existing target,
+        # it belongs to another tenant
+        try:
+            await self.db[old_collection_name].rename(new_collection_name, dropTarget=False)
+        except OperationFailure as exc:
+            if exc.code == NAMESPACE_EXISTS:
+                raise ValueError("Organization name already exists") from exc
+            if exc.code != NAMESPACE_NOT_FOUND:
+                raise
+            await self._ensure_collection_exists(new_collection_name)
+
+    @staticmethod
+    def _duplicate_key_message(exc: DuplicateKeyError, name_message: str = "Organization already exists") -> str:
+        key_pattern = (exc.details or {}).get("keyPattern") or {}
+        if "email" in key_pattern:
+            return "Email already registered"
+        return name_message
 
     def _serialize_org(self, org_doc: Dict[str, Any]) -> OrganizationResponse:
         """Serialize organization document to response model (excludes password_hash)."""
-        return OrganizationResponse(
+        # Fields come from our own validated writes, so skip re-validating them
+        return OrganizationResponse.model_construct(
             id=str(org_doc["_id"]),
             organization_name=org_doc["name"],
             email=org_doc["email"],
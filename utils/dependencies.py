@@ -1,3 +1,4 @@
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
@@ -13,14 +14,10 @@ def get_current_admin(credentials: HTTPAuthorizationCredentials | None = Depends
 
     token = credentials.credentials
 
+    # Required claims are enforced by JWTHandler.decode_token, so cached hits skip re-checking them
     try:
-        payload = JWTHandler.decode_token(token)
+        return JWTHandler.decode_token(token)
+    except jwt.MissingRequiredClaimError as exc:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token missing required claims") from exc
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token") from exc
-
-    if "admin_email" not in payload or "organization_name" not in payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token missing required claims (admin_email, organization_name)"
-        )
-
-    return payload
@@ -1,22 +1,89 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import jwt
 
 from app.core.config import settings
 
+# Settings are fixed for the process lifetime; snapshot them once at import
+_SECRET_KEY = settings.secret_key.encode("utf-8")
+_ALGORITHM = settings.jwt_algorithm
+_ALGORITHMS = [_ALGORITHM]
+_EXPIRE_DELTA = timedelta(minutes=settings.access_token_expire_minutes)
+_DECODE_OPTIONS = {"require": ["exp", "admin_email", "organization_name"]}
+
+DECODE_CACHE_MAXSIZE = 10_000
+DECODE_CACHE_TTL_SECONDS = 30
+
+
+class _DecodedTokenCache:
+    """Bounded LRU cache of verified JWT claims, keyed by a digest of the token."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(token: str) -> bytes:
+        # Store a digest rather than the raw bearer token.
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            # Hand out a copy so callers can't mutate the claims shared across requests
+            return dict(payload)
+
+    def set(self, key: bytes, payload: Dict[str, Any]) -> None:
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        with self._lock:
+            self._entries[key] = (dict(payload), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_decode_cache = _DecodedTokenCache(DECODE_CACHE_MAXSIZE, DECODE_CACHE_TTL_SECONDS)
+
 
 class JWTHandler:
     """Utility class for encoding and decoding JWT tokens."""
 
     @staticmethod
     def create_access_token(subject: Dict[str, Any]) -> str:
-        expire_minutes = settings.access_token_expire_minutes
-        expire = datetime.now(timezone.utc) + timedelta(minutes=expire_minutes)
-        payload = {"exp": expire, "iat": datetime.now(timezone.utc), **subject}
-        token = jwt.encode(payload, settings.secret_key, algorithm=settings.jwt_algorithm)
+        now = datetime.now(timezone.utc)
+        payload = {"exp": now + _EXPIRE_DELTA, "iat": now, **subject}
+        token = jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM)
         return token
 
     @staticmethod
     def decode_token(token: str) -> Dict[str, Any]:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
+        """Decode and verify a token, reusing recently verified claims for the same token."""
+        # Reject anything that isn't header.payload.signature before hashing or verifying it
+        if token.count(".") != 2:
+            raise jwt.DecodeError("Invalid token segments")
+
+        key = _decode_cache.key_for(token)
+        payload = _decode_cache.get(key)
+        if payload is not None:
+            return payload
+
+        payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+        _decode_cache.set(key, payload)
+        return payload
@@ -1,3 +1,5 @@
+import asyncio
+
 import bcrypt
 
 
@@ -13,3 +15,15 @@ class PasswordHasher:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    @staticmethod
+    async def hash_password_async(plain_password: str) -> str:
+        """Hash in the default executor so bcrypt doesn't block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, PasswordHasher.hash_password, plain_password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify in the default executor so bcrypt doesn't block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, PasswordHasher.verify_password, plain_password, hashed_password)